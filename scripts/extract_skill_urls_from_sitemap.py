@@ -10,17 +10,51 @@ Notes:
 """
 
 import argparse
+import gzip
+import io
 import re
 import sys
+import xml.etree.ElementTree as ET
+import zlib
 from urllib.request import Request, urlopen
 
 SITEMAP_URL = "https://agent-skills.cc/sitemap.xml"
+SKILL_URL_PREFIX = "https://agent-skills.cc/skills/"
 
+# fallback for sitemaps that are not well-formed XML
+URL_RE = re.compile(r"https?://[^<\s]+")
 
-def fetch(url: str) -> str:
-    req = Request(url, headers={"User-Agent": "clawdbot-agent-skills-search/1.0"})
+
+def fetch(url: str) -> bytes:
+    req = Request(
+        url,
+        headers={"User-Agent": "clawdbot-agent-skills-search/1.0", "Accept-Encoding": "gzip, deflate"},
+    )
     with urlopen(req, timeout=30) as resp:
-        return resp.read().decode("utf-8", errors="replace")
+        encoding = resp.headers.get("Content-Encoding", "").lower()
+        if encoding == "gzip":
+            return gzip.GzipFile(fileobj=resp).read()
+        data = resp.read()
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(data)
+        except zlib.error:  # raw deflate stream without zlib header
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    return data
+
+
+def iter_locs(xml: bytes):
+    # stream <loc> texts without building the whole tree
+    try:
+        for _event, el in ET.iterparse(io.BytesIO(xml)):
+            if el.tag.rpartition("}")[2] == "loc" and el.text:
+                yield el.text.strip()
+            el.clear()
+    except ET.ParseError as e:
+        # truncated / non-XML body: fall back to a plain URL scan (callers
+        # filter by prefix and de-dupe, so repeats of the above are harmless)
+        sys.stderr.write(f"[warn] sitemap is not well-formed XML ({e}); scanning for URLs\n")
+        yield from URL_RE.findall(xml.decode("utf-8", "replace"))
 
 
 def main() -> int:
@@ -32,16 +66,10 @@ def main() -> int:
 
     xml = fetch(args.sitemap)
 
-    urls = re.findall(r"https://agent-skills\.cc/skills/[^<\s]+", xml)
+    urls = (u for u in iter_locs(xml) if u.startswith(SKILL_URL_PREFIX))
 
     # de-dupe while keeping order
-    seen = set()
-    out = []
-    for u in urls:
-        if u in seen:
-            continue
-        seen.add(u)
-        out.append(u)
+    out = list(dict.fromkeys(urls))
 
     if args.contains:
         needle = args.contains.lower()
@@ -19,37 +19,63 @@ Notes:
 """
 
 import argparse
+import gzip
+import io
 import re
 import sys
+import xml.etree.ElementTree as ET
+import zlib
 from urllib.request import Request, urlopen
 
 SOURCES = {
     "agent-skills": {
         "sitemap": "https://agent-skills.cc/sitemap.xml",
-        "pattern": r"https://agent-skills\.cc/skills/[^<\s]+",
+        "prefix": "https://agent-skills.cc/skills/",
     },
     "skills-sh": {
         "sitemap": "https://skills.sh/sitemap.xml",
-        "pattern": r"https://skills\.sh/[^<\s]+",
+        "prefix": "https://skills.sh/",
     },
 }
 
+# fallback for sitemaps that are not well-formed XML
+URL_RE = re.compile(r"https?://[^<\s]+")
 
-def fetch(url: str) -> str:
-    req = Request(url, headers={"User-Agent": "clawdbot-agent-skills-search/1.1"})
+
+def fetch(url: str) -> bytes:
+    req = Request(
+        url,
+        headers={"User-Agent": "clawdbot-agent-skills-search/1.1", "Accept-Encoding": "gzip, deflate"},
+    )
     with urlopen(req, timeout=30) as resp:
-        return resp.read().decode("utf-8", errors="replace")
+        encoding = resp.headers.get("Content-Encoding", "").lower()
+        if encoding == "gzip":
+            return gzip.GzipFile(fileobj=resp).read()
+        data = resp.read()
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(data)
+        except zlib.error:  # raw deflate stream without zlib header
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    return data
+
+
+def iter_locs(xml: bytes):
+    # stream <loc> texts without building the whole tree
+    try:
+        for _event, el in ET.iterparse(io.BytesIO(xml)):
+            if el.tag.rpartition("}")[2] == "loc" and el.text:
+                yield el.text.strip()
+            el.clear()
+    except ET.ParseError as e:
+        # truncated / non-XML body: fall back to a plain URL scan (callers
+        # filter by prefix and de-dupe, so repeats of the above are harmless)
+        sys.stderr.write(f"[warn] sitemap is not well-formed XML ({e}); scanning for URLs\n")
+        yield from URL_RE.findall(xml.decode("utf-8", "replace"))
 
 
 def dedupe_keep_order(urls):
-    seen = set()
-    out = []
-    for u in urls:
-        if u in seen:
-            continue
-        seen.add(u)
-        out.append(u)
-    return out
+    return list(dict.fromkeys(urls))
 
 
 def main() -> int:
@@ -70,7 +96,7 @@ def main() -> int:
 
     xml = fetch(sitemap_url)
 
-    urls = re.findall(src["pattern"], xml)
+    urls = (u for u in iter_locs(xml) if u.startswith(src["prefix"]))
     urls = dedupe_keep_order(urls)
 
     if args.contains:
@@ -13,30 +13,84 @@ Usage examples:
   python3 scripts/search_skills.py "rag" "vector" --limit 12
   python3 scripts/search_skills.py expo --source skills-sh
   python3 scripts/search_skills.py security --fetch 40 --limit 8
+  python3 scripts/search_skills.py docker --workers 4 --sleep 0.2
 
 Notes:
 - The web pages change; extraction is best-effort.
 - To keep runs fast, we shortlist candidates by URL path match first,
-  then fetch details for the top M candidates.
+  then fetch details for the top M candidates (concurrently, see --workers).
+- Only `urllib3` is required (it also comes with `requests`). If
+  `selectolax` is installed it is used to parse pages (faster);
+  otherwise a regex-based fallback is used.
+- Like `requests`, HTTP(S)_PROXY / NO_PROXY are honoured and
+  REQUESTS_CA_BUNDLE (or `certifi`, when installed) supplies the CAs.
+- Sitemaps are cached under ~/.cache/agent-skills-search/ (see --cache-ttl).
 """
 
 from __future__ import annotations
 
 import argparse
 import dataclasses
+import hashlib
 import html
+import io
+import json
+import os
 import re
 import sys
+import tempfile
+import threading
 import time
-from typing import Iterable, List, Optional, Tuple
-
-import requests
+import urllib.request
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+import urllib3
+from urllib3.util.retry import Retry
+
+try:  # optional: Mozilla CA bundle, as used by requests
+    import certifi
+except ImportError:
+    certifi = None
+
+try:  # optional: C-backed (lexbor) HTML parser, parses each page in a single pass
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
 
 UA = "clawdbot-agent-skills-search/1.2 (+https://github.com/newuni/agent-skills-search-skill)"
 TIMEOUT = 25
+POOL_MAXSIZE = 16
 
 AGENT_SKILLS_SITEMAP = "https://agent-skills.cc/sitemap.xml"
 SKILLS_SH_SITEMAP = "https://skills.sh/sitemap.xml"
+SITEMAPS = {"agent-skills.cc": AGENT_SKILLS_SITEMAP, "skills.sh": SKILLS_SH_SITEMAP}
+
+# Sitemaps change slowly; keep a local copy for a day by default.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "agent-skills-search"
+SITEMAP_TTL = 86400
+
+# Patterns are compiled once at import time; they run for every fetched page.
+_RE_H1 = re.compile(r"<h1[^>]*>([\s\S]*?)</h1>", re.I)
+_RE_TITLE = re.compile(r"<title[^>]*>([\s\S]*?)</title>", re.I)
+_RE_TITLE_SUFFIX = re.compile(r"\s*\|\s*.*$")
+_RE_META_DESC = re.compile(
+    r"<meta[^>]+name=[\"']description[\"'][^>]+content=[\"']([^\"']+)[\"']",
+    re.I,
+)
+_RE_P = re.compile(r"<p[^>]*>([\s\S]*?)</p>", re.I)
+# script/style blocks (with their contents) or any other single tag
+_RE_MARKUP = re.compile(r"<script[\s\S]*?</script>|<style[\s\S]*?</style>|<[^>]+>", re.I)
+_RE_WS = re.compile(r"\s+")
+_RE_HREF = re.compile(r"href=[\"']([^\"']+)[\"']", re.I)
+_RE_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_RE_GH = re.compile(r"https?://github\.com/([^/\s]+)/([^/\s#?]+)")
+_RE_GIT_SUFFIX = re.compile(r"\.git$")
+_RE_SKILLS_SH_URL = re.compile(r"https?://skills\.sh/([^/]+)/([^/]+)/.+")
+_RE_SITEMAP_URL = re.compile(r"https?://[^<\s]+")
 
 
 @dataclasses.dataclass
@@ -49,74 +103,291 @@ class Skill:
     github_repo: str = ""  # owner/repo
     install_hint: str = ""
     score: float = 0.0
+    # lower-cased copies used for scoring, filled in by fetch_details()
+    _title_lc: str = dataclasses.field(default="", init=False, repr=False, compare=False)
+    _desc_lc: str = dataclasses.field(default="", init=False, repr=False, compare=False)
+    _url_lc: str = dataclasses.field(default="", init=False, repr=False, compare=False)
 
 
-def _get(url: str) -> str:
-    r = requests.get(url, headers={"User-Agent": UA}, timeout=TIMEOUT)
-    r.raise_for_status()
-    return r.text
+class KeywordMatcher:
+    """Query keywords, with their lower-cased forms precomputed."""
 
+    def __init__(self, keywords: List[str]) -> None:
+        self.keywords = keywords
+        self.lowered = [k.lower() for k in keywords]
 
-def _dedupe_keep_order(items: Iterable[str]) -> List[str]:
-    seen = set()
-    out = []
-    for it in items:
-        if it in seen:
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+
+# Sitemap XML compresses >10x; urllib3 decodes whatever we advertise
+# (gzip/deflate, plus br/zstd when their optional packages are installed).
+_HEADERS = {"User-Agent": UA, **urllib3.util.make_headers(accept_encoding=True)}
+
+
+def _ca_certs() -> Optional[str]:
+    # same lookup order as requests; None means the system default store
+    bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+    if bundle:
+        return bundle
+    return certifi.where() if certifi is not None else None
+
+
+# One keep-alive pool per host: every sitemap + page fetch hits the same
+# two hosts, so reusing connections skips a TCP/TLS handshake per URL.
+_POOL_KW = dict(
+    num_pools=4,
+    maxsize=POOL_MAXSIZE,
+    headers=_HEADERS,
+    # separate budgets: redirects must not use up the error retries (requests
+    # followed up to 30 redirects on its own and retried errors twice)
+    retries=Retry(total=None, connect=2, read=2, other=2, redirect=30, backoff_factor=0.2),
+    timeout=TIMEOUT,
+    ca_certs=_ca_certs(),
+)
+_POOL = urllib3.PoolManager(**_POOL_KW)
+
+
+def _proxy_pools() -> Dict[str, urllib3.ProxyManager]:
+    # Proxies from the environment (HTTP_PROXY / HTTPS_PROXY, or the OS
+    # settings), one pool per scheme. Only http(s):// proxy URLs are supported.
+    pools: Dict[str, urllib3.ProxyManager] = {}
+    for scheme, proxy in urllib.request.getproxies().items():
+        if scheme not in ("http", "https"):
+            continue
+        if "://" not in proxy:
+            proxy = "http://" + proxy  # bare host:port, as requests assumes
+        parts = urlsplit(proxy)
+        if parts.scheme not in ("http", "https"):
+            sys.stderr.write(
+                f"[warn] ignoring {parts.scheme}:// proxy for {scheme} URLs: only http(s) proxies are supported\n"
+            )
             continue
-        seen.add(it)
-        out.append(it)
-    return out
+        proxy_headers: Dict[str, str] = {}
+        if parts.username is not None:
+            # urllib3 does not read credentials from the proxy URL itself
+            auth = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            proxy_headers = urllib3.make_headers(proxy_basic_auth=auth)
+            proxy = parts._replace(netloc=parts.netloc.rpartition("@")[2]).geturl()
+        pools[scheme] = urllib3.ProxyManager(proxy, proxy_headers=proxy_headers, **_POOL_KW)
+    return pools
+
+
+_PROXY_POOLS = _proxy_pools()
+
+
+def _pool_for(url: str) -> urllib3.PoolManager:
+    parts = urlsplit(url)
+    pool = _PROXY_POOLS.get(parts.scheme)
+    if pool is None or urllib.request.proxy_bypass(parts.hostname or ""):  # NO_PROXY
+        return _POOL
+    return pool
+
+
+def _request(url: str, headers: Optional[Dict[str, str]] = None) -> urllib3.BaseHTTPResponse:
+    r = _pool_for(url).request("GET", url, headers={**_HEADERS, **(headers or {})}, preload_content=False)
+    if r.status >= 400:
+        r.release_conn()
+        raise urllib3.exceptions.HTTPError(f"{r.status} error for url: {url}")
+    return r
+
 
+def _charset(r: urllib3.BaseHTTPResponse) -> str:
+    m = _RE_CHARSET.search(r.headers.get("Content-Type", ""))
+    return m.group(1) if m else "utf-8"
 
-def _extract_sitemap_urls(xml: str, source: str) -> List[str]:
+
+def _get(url: str) -> str:
+    r = _request(url)
+    try:
+        data = r.read()
+    finally:
+        r.release_conn()
+    try:
+        return data.decode(_charset(r), "replace")
+    except LookupError:  # unknown charset label
+        return data.decode("utf-8", "replace")
+
+
+def _get_if_modified(url: str, etag: str = "", last_modified: str = "") -> Tuple[Optional[bytes], Dict[str, str]]:
+    """Conditional GET: returns (None, {}) on 304, else (body, validators)."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    r = _request(url, headers)
+    try:
+        if r.status == 304:
+            return None, {}
+        data = r.read()
+    finally:
+        r.release_conn()
+    validators = {}
+    if r.headers.get("ETag"):
+        validators["etag"] = r.headers["ETag"]
+    if r.headers.get("Last-Modified"):
+        validators["last_modified"] = r.headers["Last-Modified"]
+    return data, validators
+
+
+def _dedupe_keep_order(items: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(items))
+
+
+def _sitemap_cache_path(url: str) -> Path:
+    return CACHE_DIR / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".xml")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _read_cached_sitemap(url: str) -> Optional[bytes]:
+    try:
+        return _sitemap_cache_path(url).read_bytes()
+    except OSError:
+        return None
+
+
+def _cache_sitemap(url: str, data: bytes, validators: Dict[str, str]) -> None:
+    path = _sitemap_cache_path(url)
+    try:
+        _write_atomic(path, data)
+        _write_atomic(path.with_suffix(".json"), json.dumps(validators).encode("utf-8"))
+    except OSError as e:
+        # caching is best-effort (e.g. read-only home)
+        sys.stderr.write(f"[warn] could not cache sitemap {url}: {e}\n")
+
+
+def _get_sitemap(url: str, ttl: float = SITEMAP_TTL) -> Tuple[bytes, Optional[Dict[str, str]]]:
+    """Fetch a sitemap, serving it from the disk cache while younger than `ttl`.
+
+    Stale copies are revalidated with ETag / Last-Modified, so an unchanged
+    sitemap costs a 304 instead of a full download, and are served as-is if
+    the network fails. Returns (body, validators); validators are only set
+    for a fresh download, which the caller stores with _cache_sitemap() once
+    it has parsed.
+    """
+    path = _sitemap_cache_path(url)
+    cached: Optional[bytes] = None
+    validators: Dict[str, str] = {}
+    try:
+        mtime = path.stat().st_mtime
+        cached = path.read_bytes()
+        if ttl > 0 and time.time() - mtime < ttl:
+            return cached, None
+        validators = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+
+    try:
+        data, validators = _get_if_modified(url, validators.get("etag", ""), validators.get("last_modified", ""))
+    except urllib3.exceptions.HTTPError as e:
+        if cached is None:
+            raise
+        sys.stderr.write(f"[warn] could not refresh sitemap {url} ({e}); using the cached copy\n")
+        return cached, None
+    if data is not None:
+        return data, validators
+    # 304: the cached copy is still current, restart its TTL
+    try:
+        os.utime(path)
+    except OSError as e:
+        sys.stderr.write(f"[warn] could not cache sitemap {url}: {e}\n")
+    return cached, None
+
+
+def _sitemap_urls(source: str, ttl: float = SITEMAP_TTL) -> List[str]:
+    if source not in SITEMAPS:
+        raise ValueError(f"unknown source {source}")
+    url = SITEMAPS[source]
+    xml, validators = _get_sitemap(url, ttl)
+    try:
+        urls = _extract_sitemap_urls(xml, source)
+    except ET.ParseError as e:
+        # Truncated download or an HTML challenge page: never cache it, so the
+        # next run goes back to the network. Use the previous copy if there is
+        # one, else scan the body as plain text.
+        sys.stderr.write(f"[warn] sitemap {url} is not well-formed XML ({e})\n")
+        if validators is not None:
+            cached = _read_cached_sitemap(url)
+            if cached is not None:
+                try:
+                    return _extract_sitemap_urls(cached, source)
+                except ET.ParseError:
+                    pass
+        return _filter_sitemap_urls(_RE_SITEMAP_URL.findall(xml.decode("utf-8", "replace")), source)
+    if validators is not None:
+        _cache_sitemap(url, xml, validators)
+    return urls
+
+
+def _iter_sitemap_locs(xml: bytes) -> Iterator[str]:
+    # Stream <loc> texts; elements are cleared as we go so large sitemaps
+    # never build a full tree in memory. Raises ET.ParseError on bodies that
+    # are not well-formed XML.
+    for _event, el in ET.iterparse(io.BytesIO(xml)):
+        if el.tag.rpartition("}")[2] == "loc" and el.text:
+            yield el.text.strip()
+        el.clear()
+
+
+def _filter_sitemap_urls(locs: Iterable[str], source: str) -> List[str]:
     if source == "agent-skills.cc":
-        urls = re.findall(r"https://agent-skills\.cc/skills/[^<\s]+", xml)
+        urls = (u for u in locs if u.startswith("https://agent-skills.cc/skills/"))
     elif source == "skills.sh":
-        # skills.sh sitemap lists full detail URLs
-        urls = re.findall(r"https://skills\.sh/[^<\s]+", xml)
-        # avoid non-skill pages if they ever appear
-        urls = [u for u in urls if u.count("/") >= 5]  # https://skills.sh/a/b/c
+        # skills.sh sitemap lists full detail URLs; avoid non-skill pages
+        # if they ever appear (https://skills.sh/a/b/c)
+        urls = (u for u in locs if u.startswith("https://skills.sh/") and u.count("/") >= 5)
     else:
         raise ValueError(f"unknown source: {source}")
     return _dedupe_keep_order(urls)
 
 
+def _extract_sitemap_urls(xml: bytes, source: str) -> List[str]:
+    return _filter_sitemap_urls(_iter_sitemap_locs(xml), source)
+
+
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return _RE_WS.sub(" ", s or "").strip()
 
 
 def _strip_tags(s: str) -> str:
     # very small HTML-to-text helper
-    s = re.sub(r"<script[\s\S]*?</script>", " ", s, flags=re.I)
-    s = re.sub(r"<style[\s\S]*?</style>", " ", s, flags=re.I)
-    s = re.sub(r"<[^>]+>", " ", s)
+    s = _RE_MARKUP.sub(" ", s)
     s = html.unescape(s)
     return _norm(s)
 
 
 def _extract_title_description(page_html: str) -> Tuple[str, str]:
     # Prefer H1 for title
-    h1 = re.search(r"<h1[^>]*>([\s\S]*?)</h1>", page_html, flags=re.I)
+    h1 = _RE_H1.search(page_html)
     title = _strip_tags(h1.group(1)) if h1 else ""
 
     if not title:
-        t = re.search(r"<title[^>]*>([\s\S]*?)</title>", page_html, flags=re.I)
+        t = _RE_TITLE.search(page_html)
         title = _strip_tags(t.group(1)) if t else ""
-        title = re.sub(r"\s*\|\s*.*$", "", title)  # trim site suffix
+        title = _RE_TITLE_SUFFIX.sub("", title)  # trim site suffix
 
     # Meta description is often decent
-    md = re.search(
-        r"<meta[^>]+name=[\"']description[\"'][^>]+content=[\"']([^\"']+)[\"']",
-        page_html,
-        flags=re.I,
-    )
+    md = _RE_META_DESC.search(page_html)
     desc = _norm(html.unescape(md.group(1))) if md else ""
 
-    # If missing, take first non-trivial paragraph
+    # If missing, take first non-trivial paragraph (stop at the first hit)
     if not desc:
-        paras = re.findall(r"<p[^>]*>([\s\S]*?)</p>", page_html, flags=re.I)
-        for p in paras[:8]:
-            text = _strip_tags(p)
+        for i, p in enumerate(_RE_P.finditer(page_html)):
+            if i >= 8:
+                break
+            text = _strip_tags(p.group(1))
             if len(text) >= 40:
                 desc = text
                 break
@@ -125,7 +396,10 @@ def _extract_title_description(page_html: str) -> Tuple[str, str]:
 
 
 def _extract_outbound_links(page_html: str) -> List[str]:
-    hrefs = re.findall(r"href=[\"']([^\"']+)[\"']", page_html, flags=re.I)
+    return _filter_outbound_links(_RE_HREF.findall(page_html))
+
+
+def _filter_outbound_links(hrefs: Iterable[str]) -> List[str]:
     out = []
     for h in hrefs:
         if h.startswith("/"):
@@ -141,121 +415,193 @@ def _extract_outbound_links(page_html: str) -> List[str]:
     return _dedupe_keep_order(out)
 
 
+def _parse_page_selectolax(page_html: str) -> Tuple[str, str, List[str]]:
+    tree = HTMLParser(page_html)
+    # Keep inline code out of the extracted text (the regex path drops it too)
+    tree.strip_tags(["script", "style"])
+
+    # Prefer H1 for title
+    h1 = tree.css_first("h1")
+    title = _norm(h1.text(separator=" ")) if h1 else ""
+
+    if not title:
+        t = tree.css_first("title")
+        title = _norm(t.text(separator=" ")) if t else ""
+        title = _RE_TITLE_SUFFIX.sub("", title)  # trim site suffix
+
+    md = tree.css_first('meta[name="description" i]')
+    desc = _norm(md.attributes.get("content") or "") if md else ""
+
+    # If missing, take first non-trivial paragraph
+    if not desc:
+        for p in tree.css("p")[:8]:
+            text = _norm(p.text(separator=" "))
+            if len(text) >= 40:
+                desc = text
+                break
+
+    hrefs = (n.attributes.get("href") or "" for n in tree.css("[href]"))
+    return _norm(title), _norm(desc), _filter_outbound_links(hrefs)
+
+
+def _parse_page(page_html: str) -> Tuple[str, str, List[str]]:
+    """Return (title, description, outbound_links) for a skill page."""
+    if HTMLParser is not None:
+        return _parse_page_selectolax(page_html)
+    title, desc = _extract_title_description(page_html)
+    return title, desc, _extract_outbound_links(page_html)
+
+
 def _extract_github_repo(links: Iterable[str]) -> str:
     for l in links:
-        m = re.search(r"https?://github\.com/([^/\s]+)/([^/\s#?]+)", l)
+        m = _RE_GH.search(l)
         if not m:
             continue
         owner, repo = m.group(1), m.group(2)
         # strip .git
-        repo = re.sub(r"\.git$", "", repo)
+        repo = _RE_GIT_SUFFIX.sub("", repo)
         return f"{owner}/{repo}"
     return ""
 
 
 def _skills_sh_owner_repo_from_url(url: str) -> str:
     # https://skills.sh/<owner>/<repo>/<slug>
-    m = re.match(r"https?://skills\.sh/([^/]+)/([^/]+)/.+", url)
+    m = _RE_SKILLS_SH_URL.match(url)
     if not m:
         return ""
     return f"{m.group(1)}/{m.group(2)}"
 
 
-def _keyword_score(text: str, keywords: List[str]) -> float:
-    t = text.lower()
+def _keyword_score(t: str, matcher: KeywordMatcher) -> float:
+    # `t` must already be lower-cased
     score = 0.0
-    for kw in keywords:
-        k = kw.lower()
+    for k in matcher.lowered:
         if not k:
             continue
-        if k in t:
+        # one find() per keyword: it both tests and locates the hit
+        idx = t.find(k)
+        if idx >= 0:
             # reward earlier hits a bit
-            idx = t.find(k)
             score += 10.0
             score += max(0.0, 5.0 - min(5.0, idx / 40.0))
     return score
 
 
-def _score_candidate(url: str, keywords: List[str]) -> float:
-    path = url.lower()
-    score = _keyword_score(path, keywords)
+def _score_candidate(url_lc: str, matcher: KeywordMatcher) -> float:
+    score = _keyword_score(url_lc, matcher)
     # small bonus for more specific paths
-    score += min(3.0, path.count("-") * 0.2)
+    score += min(3.0, url_lc.count("-") * 0.2)
     return score
 
 
-def discover_candidates(keywords: List[str], source: str) -> List[Tuple[str, float]]:
-    if source == "agent-skills.cc":
-        xml = _get(AGENT_SKILLS_SITEMAP)
-        urls = _extract_sitemap_urls(xml, "agent-skills.cc")
-    elif source == "skills.sh":
-        xml = _get(SKILLS_SH_SITEMAP)
-        urls = _extract_sitemap_urls(xml, "skills.sh")
-    else:
-        raise ValueError(f"unknown source {source}")
+def discover_candidates(
+    matcher: KeywordMatcher, source: str, cache_ttl: float = SITEMAP_TTL
+) -> Tuple[List[Tuple[str, float]], List[Tuple[str, float]]]:
+    """Return (matching, all) sitemap URLs with their scores, best first.
 
-    scored = [(u, _score_candidate(u, keywords)) for u in urls]
+    `all` lets callers fall back to the unfiltered head without fetching
+    or scoring the sitemap again.
+    """
+    urls = _sitemap_urls(source, cache_ttl)
+
+    scored = [(u, _score_candidate(u.lower(), matcher)) for u in urls]
     scored.sort(key=lambda x: x[1], reverse=True)
     # If no keywords, just return head
-    if not keywords:
-        return scored
+    if not matcher:
+        return scored, scored
     # Keep only those with some match; fallback later if too few
     keep = [s for s in scored if s[1] > 0]
-    return keep
+    return keep, scored
+
+
+# Pool for long strings that repeat across pages (sys.intern covers short ones).
+_STR_POOL: Dict[str, str] = {}
+
+
+def _shared(s: str) -> str:
+    # outbound links / repos repeat a lot across pages; keep a single copy
+    if len(s) < 200:
+        return sys.intern(s)
+    return _STR_POOL.setdefault(s, s)
 
 
 def fetch_details(url: str, source: str) -> Skill:
     page = _get(url)
-    title, desc = _extract_title_description(page)
-    links = _extract_outbound_links(page)
-    gh = _extract_github_repo(links)
+    title, desc, links = _parse_page(page)
+    links = [_shared(l) for l in links]
+    gh = _shared(_extract_github_repo(links))
 
     sk = Skill(source=source, page_url=url, title=title, description=desc, outbound_links=links, github_repo=gh)
 
     if source == "skills.sh":
         if not sk.github_repo:
-            sk.github_repo = _skills_sh_owner_repo_from_url(url)
+            sk.github_repo = _shared(_skills_sh_owner_repo_from_url(url))
         if sk.github_repo:
             sk.install_hint = f"npx skills add {sk.github_repo}"
 
+    sk._title_lc = title.lower()
+    sk._desc_lc = desc.lower()
+    sk._url_lc = url.lower()
     return sk
 
 
+class _Throttle:
+    """Space fetch starts at least `interval` seconds apart, across threads."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def fetch_all(urls: List[str], source: str, workers: int, throttle: _Throttle) -> List[Skill]:
+    """Fetch details for `urls` concurrently; results keep the input order."""
+
+    def _task(url: str) -> Skill:
+        throttle.wait()
+        return fetch_details(url, source)
+
+    results: List[Optional[Skill]] = [None] * len(urls)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futs = {ex.submit(_task, u): i for i, u in enumerate(urls)}
+        for f in as_completed(futs):
+            i = futs[f]
+            try:
+                results[i] = f.result()
+            except Exception as e:
+                # best-effort: keep going
+                sys.stderr.write(f"[warn] {source} fetch failed: {urls[i]} ({e})\n")
+    return [sk for sk in results if sk is not None]
+
+
 def dedupe(skills: List[Skill]) -> List[Skill]:
-    # Prefer de-dupe by github repo, else by page_url
-    by_repo = {}
-    out = []
+    # Prefer de-dupe by github repo, else by page_url; one pass, first-seen
+    # order, keeping the entry with the longer description per key
+    best: Dict[Tuple[str, str], Skill] = {}
     for s in skills:
-        key = s.github_repo.lower() if s.github_repo else ""
-        if key:
-            if key in by_repo:
-                # Keep the one with a description (or longer)
-                prev = by_repo[key]
-                if len(s.description) > len(prev.description):
-                    by_repo[key] = s
-                continue
-            by_repo[key] = s
-            out.append(s)
-        else:
-            out.append(s)
-
-    # secondary de-dupe by URL
-    uniq = []
-    seen = set()
-    for s in out:
-        if s.page_url in seen:
-            continue
-        seen.add(s.page_url)
-        uniq.append(s)
-    return uniq
+        key = ("repo", s.github_repo.lower()) if s.github_repo else ("url", s.page_url)
+        prev = best.get(key)
+        if prev is None or len(s.description) > len(prev.description):
+            best[key] = s
+    return list(best.values())
 
 
-def rank(skills: List[Skill], keywords: List[str]) -> List[Skill]:
+def rank(skills: List[Skill], matcher: KeywordMatcher) -> List[Skill]:
     for s in skills:
         s.score = 0.0
-        s.score += 2.0 * _keyword_score(s.title, keywords)
-        s.score += 1.2 * _keyword_score(s.description, keywords)
-        s.score += 0.8 * _keyword_score(s.page_url, keywords)
+        s.score += 2.0 * _keyword_score(s._title_lc, matcher)
+        s.score += 1.2 * _keyword_score(s._desc_lc, matcher)
+        s.score += 0.8 * _keyword_score(s._url_lc, matcher)
         # Slight preference: if we found a GitHub repo, it's usually more useful
         if s.github_repo:
             s.score += 2.0
@@ -315,41 +661,46 @@ def main() -> int:
         default=40,
         help="how many top URL-path candidates to fetch details for (per source)",
     )
-    ap.add_argument("--sleep", type=float, default=0.0, help="sleep between fetches (seconds)")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help=f"how many pages to fetch concurrently (max {POOL_MAXSIZE})",
+    )
+    ap.add_argument("--sleep", type=float, default=0.0, help="min delay between fetch starts (seconds)")
+    ap.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=SITEMAP_TTL,
+        help=f"reuse cached sitemaps younger than this (seconds, 0 = always refetch; cache: {CACHE_DIR})",
+    )
     args = ap.parse_args()
 
     keywords = [k.strip() for k in args.keywords if k.strip()]
     if len(keywords) > 5:
         keywords = keywords[:5]
+    matcher = KeywordMatcher(keywords)
 
     sources = ["agent-skills.cc", "skills.sh"] if args.source == "all" else [args.source]
+    # never run more threads than the pool keeps connections for
+    workers = max(1, min(args.workers, POOL_MAXSIZE))
+    throttle = _Throttle(args.sleep)
 
     all_skills: List[Skill] = []
 
     for src in sources:
-        candidates = discover_candidates(keywords, src)
+        candidates, scored = discover_candidates(matcher, src, args.cache_ttl)
         # fallback: if keyword filter yields too few, take top anyway
         if len(candidates) < max(10, args.fetch // 2):
-            # pull unfiltered head
-            xml = _get(AGENT_SKILLS_SITEMAP if src == "agent-skills.cc" else SKILLS_SH_SITEMAP)
-            urls = _extract_sitemap_urls(xml, src)
-            candidates = [(u, _score_candidate(u, keywords)) for u in urls]
-            candidates.sort(key=lambda x: x[1], reverse=True)
+            # unfiltered head (same sort as the keyword matches)
+            candidates = scored
 
         shortlist = [u for (u, _s) in candidates[: max(1, args.fetch)]]
 
-        for u in shortlist:
-            try:
-                sk = fetch_details(u, src)
-                all_skills.append(sk)
-            except Exception as e:
-                # best-effort: keep going
-                sys.stderr.write(f"[warn] {src} fetch failed: {u} ({e})\n")
-            if args.sleep:
-                time.sleep(args.sleep)
+        all_skills.extend(fetch_all(shortlist, src, workers, throttle))
 
     all_skills = dedupe(all_skills)
-    all_skills = rank(all_skills, keywords)
+    all_skills = rank(all_skills, matcher)
 
     sys.stdout.write(render_markdown(all_skills, keywords, args.limit))
     return 0